@@ -21,7 +21,7 @@ fi
 # Install dependencies
 echo "Installing Python and dependencies..."
 apt-get update
-apt-get install -y python3 python3-venv python3-pip
+apt-get install -y python3 python3-venv python3-pip nginx
 
 # Create directory structure
 echo "Setting up directories..."
@@ -33,6 +33,7 @@ echo "Copying application files..."
 cp -r app /opt/vpn-agent/
 cp requirements.txt /opt/vpn-agent/
 cp .env.example /opt/vpn-agent/.env
+cp nginx/vpn-agent.conf /etc/nginx/sites-available/vpn-agent
 
 # Create virtual environment
 echo "Creating Python virtual environment..."
@@ -70,6 +71,13 @@ EOF
 chmod 0440 /etc/sudoers.d/vpnprov
 visudo -c
 
+# Configure nginx for TLS termination
+echo "Configuring nginx..."
+ln -sf /etc/nginx/sites-available/vpn-agent /etc/nginx/sites-enabled/vpn-agent
+nginx -t
+systemctl enable nginx
+systemctl reload-or-restart nginx
+
 # Install systemd service
 echo "Installing systemd service..."
 cp vpn-agent.service /etc/systemd/system/